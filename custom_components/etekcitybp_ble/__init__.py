@@ -21,17 +21,32 @@ from homeassistant.const import (
 )
 from homeassistant.core import CoreState, HomeAssistant
 from homeassistant.exceptions import ConfigEntryNotReady
-from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import config_validation as cv, device_registry as dr
+from homeassistant.helpers.storage import Store
+from homeassistant.helpers.typing import ConfigType
 
+from .const import CONF_PASSIVE_MODE, CONF_TRACE_SIZE, DOMAIN
 from .coordinator import EtekcityConfigEntry, EtekcityBPCoordinator
 from .device import EtekcityBPDevice
+from .services import async_setup_services
 
 
 PLATFORMS = [Platform.BINARY_SENSOR, Platform.SENSOR]
 
+STORAGE_VERSION = 1
+DUTY_CYCLE_SAVE_DELAY = 60
+
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
 _LOGGER = logging.getLogger(__name__)
 
 
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the EtekcityBP integration."""
+    async_setup_services(hass)
+    return True
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: EtekcityConfigEntry) -> bool:
     """Set up Etekcity Blood Pressure BLE device from a config entry."""
     assert entry.unique_id is not None
@@ -50,11 +65,16 @@ async def async_setup_entry(hass: HomeAssistant, entry: EtekcityConfigEntry) ->
     address = entry.unique_id
     assert address is not None
 
-    connectable = True
+    passive = entry.options.get(CONF_PASSIVE_MODE, False)
+    connectable = not passive
 
     await close_stale_connections_by_address(address)
 
-    device = EtekcityBPDevice()
+    store = _duty_cycle_store(hass, entry)
+    stored = await store.async_load() or {}
+    device = EtekcityBPDevice(
+        entry.options.get(CONF_TRACE_SIZE, 0), stored.get("hours"), passive
+    )
 
     coordinator = entry.runtime_data = EtekcityBPCoordinator(
         hass,
@@ -64,9 +84,17 @@ async def async_setup_entry(hass: HomeAssistant, entry: EtekcityConfigEntry) ->
         entry.unique_id,
         entry.data.get(CONF_NAME, entry.title),
         connectable,
+        passive,
     )
 
     entry.async_on_unload(coordinator.async_start())
+    entry.async_on_unload(
+        device.subscribe(
+            lambda: store.async_delay_save(
+                device.duty_cycle.as_dict, DUTY_CYCLE_SAVE_DELAY
+            )
+        )
+    )
 
     entry.async_on_unload(entry.add_update_listener(_async_update_listener))
 
@@ -76,6 +104,11 @@ async def async_setup_entry(hass: HomeAssistant, entry: EtekcityConfigEntry) ->
 
     return True
 
+def _duty_cycle_store(hass: HomeAssistant, entry: ConfigEntry) -> Store:
+    """Return the store for the learned measurement times of an entry."""
+    return Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}")
+
+
 async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Handle options update."""
     _LOGGER.debug("Config entry update listener called for %s", entry.entry_id)
@@ -87,3 +120,8 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return await hass.config_entries.async_unload_platforms(
         entry, PLATFORMS
     )
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the learned measurement times of a removed entry."""
+    await _duty_cycle_store(hass, entry).async_remove()
@@ -13,6 +13,7 @@ from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 
 from .coordinator import EtekcityConfigEntry, EtekcityBPCoordinator
 from .entity import EtekcityBPEntity
+from .profiler import profiled
 
 import logging
 
@@ -55,7 +56,7 @@ class EtekcityBPBinarySensor(EtekcityBPEntity, BinarySensorEntity):
         sensor: str,
     ) -> None:
         """Initialize the EtekcityBP binary sensor."""
-        _LOGGER.debug(f"Initializing binary sensor: {sensor}")
+        _LOGGER.debug("Initializing binary sensor: %s", sensor)
         super().__init__(coordinator)
         self.coordinator = coordinator
         self._sensor = sensor
@@ -63,9 +64,8 @@ class EtekcityBPBinarySensor(EtekcityBPEntity, BinarySensorEntity):
         self.entity_description = SENSOR_TYPES[sensor]
 
     @property
+    @profiled
     def is_on(self) -> bool | None:
         """Return the state of the binary sensor."""
-        value = self.sensor_data.get(self._sensor, self._attr_is_on)
-        _LOGGER.debug(f"{self._sensor} is_on: {value}")
-        return value
+        return self.sensor_data.get(self._sensor, self._attr_is_on)
 
@@ -10,18 +10,29 @@ from homeassistant.components.bluetooth import (
     BluetoothServiceInfoBleak,
     async_discovered_service_info,
 )
-from homeassistant.config_entries import ConfigFlow
+from homeassistant.config_entries import (
+    SOURCE_INTEGRATION_DISCOVERY,
+    ConfigEntry,
+    ConfigFlow,
+    OptionsFlow,
+)
+from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
-from homeassistant.const import CONF_ADDRESS
+from homeassistant.const import CONF_ADDRESS, CONF_NAME
 
 from .device import EtekcityBPDevice
-from .const import DOMAIN
+from .const import CONF_PASSIVE_MODE, CONF_TRACE_SIZE, DOMAIN
 
 import logging
 
 _LOGGER = logging.getLogger(__name__)
 
 
+def _title(name: str, address: str) -> str:
+    """Return the entry title, which tells monitors of the same model apart."""
+    return f"{name} ({address})"
+
+
 class EtekcityBPConfigFlow(ConfigFlow, domain=DOMAIN):
     """Handle a config flow for EtekcityBP."""
 
@@ -33,14 +44,19 @@ class EtekcityBPConfigFlow(ConfigFlow, domain=DOMAIN):
         # self._discovered_device: EtekcityBPDevice | None = None
         self._discovered_devices: dict[str, str] = {}
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry: ConfigEntry) -> OptionsFlow:
+        """Get the options flow for this handler."""
+        return EtekcityBPOptionsFlow()
+
     async def async_step_bluetooth(
         self, discovery_info: BluetoothServiceInfoBleak
     ) -> FlowResult:
         """Handle the bluetooth discovery step."""
         await self.async_set_unique_id(discovery_info.address)
         self._abort_if_unique_id_configured()
-        device = EtekcityBPDevice()
-        if not device.supported(discovery_info):
+        if not EtekcityBPDevice.supported(discovery_info):
             return self.async_abort(reason="not_supported")
         self._discovery_info = discovery_info
         # self._discovered_device = device
@@ -55,7 +71,7 @@ class EtekcityBPConfigFlow(ConfigFlow, domain=DOMAIN):
         assert self._discovery_info is not None
         discovery_info = self._discovery_info
         # title = device.title or device.get_device_name() or discovery_info.name
-        title = discovery_info.name
+        title = _title(discovery_info.name, discovery_info.address)
         if user_input is not None:
             return self.async_create_entry(title=title, data={})
 
@@ -70,6 +86,37 @@ class EtekcityBPConfigFlow(ConfigFlow, domain=DOMAIN):
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
         """Handle the user step to pick discovered device."""
+        current_addresses = self._async_current_ids()
+        for discovery_info in async_discovered_service_info(self.hass, False):
+            address = discovery_info.address
+            if (
+                EtekcityBPDevice.supported(discovery_info)
+                and address not in current_addresses
+            ):
+                self._discovered_devices[address] = _title(
+                    discovery_info.name, address
+                )
+
+        if not self._discovered_devices:
+            return self.async_abort(reason="no_devices_found")
+
+        if len(self._discovered_devices) == 1:
+            return await self.async_step_pick_device()
+
+        return self.async_show_menu(
+            step_id="user",
+            menu_options=["pick_device", "add_all"],
+            description_placeholders={
+                "devices": "\n".join(
+                    f"- {title}" for title in self._discovered_devices.values()
+                )
+            },
+        )
+
+    async def async_step_pick_device(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Pick one of the discovered devices."""
         if user_input is not None:
             address = user_input[CONF_ADDRESS]
             await self.async_set_unique_id(address, raise_on_progress=False)
@@ -78,26 +125,70 @@ class EtekcityBPConfigFlow(ConfigFlow, domain=DOMAIN):
                 title=self._discovered_devices[address], data={}
             )
 
-        current_addresses = self._async_current_ids()
-        for discovery_info in async_discovered_service_info(self.hass, False):
-            _LOGGER.debug(f"discovery_info: {discovery_info}")
-            _LOGGER.debug(f"manufacturer_data: {discovery_info.manufacturer_data}")
-            address = discovery_info.address
-            if address in current_addresses or address in self._discovered_devices:
-                continue
-            device = EtekcityBPDevice()
-            if device.supported(discovery_info):
-                self._discovered_devices[address] = (
-                # device.title or device.get_device_name() or discovery_info.name
-                discovery_info.name
+        return self.async_show_form(
+            step_id="pick_device",
+            data_schema=vol.Schema(
+                {vol.Required(CONF_ADDRESS): vol.In(self._discovered_devices)}
+            ),
+        )
+
+    async def async_step_add_all(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Add every discovered device at once."""
+        address, *others = self._discovered_devices
+        for other in others:
+            self.hass.async_create_task(
+                self.hass.config_entries.flow.async_init(
+                    DOMAIN,
+                    context={"source": SOURCE_INTEGRATION_DISCOVERY},
+                    data={
+                        CONF_ADDRESS: other,
+                        CONF_NAME: self._discovered_devices[other],
+                    },
+                )
             )
+        await self.async_set_unique_id(address, raise_on_progress=False)
+        self._abort_if_unique_id_configured()
+        return self.async_create_entry(
+            title=self._discovered_devices[address], data={}
+        )
+
+    async def async_step_integration_discovery(
+        self, discovery_info: dict[str, str]
+    ) -> FlowResult:
+        """Create an entry for a device chosen by add_all."""
+        await self.async_set_unique_id(
+            discovery_info[CONF_ADDRESS], raise_on_progress=False
+        )
+        self._abort_if_unique_id_configured()
+        return self.async_create_entry(title=discovery_info[CONF_NAME], data={})
 
-        if not self._discovered_devices:
-            return self.async_abort(reason="no_devices_found")
+
+class EtekcityBPOptionsFlow(OptionsFlow):
+    """Handle EtekcityBP options."""
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Manage the options."""
+        if user_input is not None:
+            return self.async_create_entry(title="", data=user_input)
 
         return self.async_show_form(
-            step_id="user",
+            step_id="init",
             data_schema=vol.Schema(
-                {vol.Required(CONF_ADDRESS): vol.In(self._discovered_devices)}
+                {
+                    vol.Optional(
+                        CONF_PASSIVE_MODE,
+                        default=self.config_entry.options.get(
+                            CONF_PASSIVE_MODE, False
+                        ),
+                    ): bool,
+                    vol.Optional(
+                        CONF_TRACE_SIZE,
+                        default=self.config_entry.options.get(CONF_TRACE_SIZE, 0),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0, max=1000)),
+                }
             ),
-        )
\ No newline at end of file
+        )
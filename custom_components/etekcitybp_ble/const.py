@@ -7,6 +7,23 @@ CHARACTERISTIC_BLOOD_PRESSURE = "0000fff1-0000-1000-8000-00805f9b34fb"
 CLIENT_CHARACTERISTIC_CONFIG = "00002902-0000-1000-8000-00805f9b34fb"
 CLIENT_CHARACTERISTIC_CONFIG_HANDLE = 14
 CLIENT_CHARACTERISTIC_CONFIG_DATA = b"\x01\x00"
+
+# The MFR_ID manufacturer payload is not documented and is only compared for
+# changes. Decode fields from it once real payloads have been captured and
+# added as test fixtures.
 MFR_ID = 1744
 UPDATE_INTERVAL = 10
-BPM = "bpm"
\ No newline at end of file
+BPM = "bpm"
+
+# Pressures are sent as mmHg, or as kPa x 10 when the monitor displays kPa.
+MMHG_PER_KPA = 7.50062
+MAX_PRESSURE_MMHG = 600
+MAX_PRESSURE_KPA_X10 = 800
+
+CONF_PASSIVE_MODE = "passive_mode"
+CONF_TRACE_SIZE = "trace_size"
+
+SERVICE_PROFILE = "profile"
+SERVICE_DUMP_TRACE = "dump_trace"
+ATTR_SECONDS = "seconds"
+ATTR_ALLOCATIONS = "allocations"
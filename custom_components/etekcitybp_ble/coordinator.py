@@ -26,6 +26,7 @@ from .const import (
     CLIENT_CHARACTERISTIC_CONFIG_DATA,
 )
 from .device import EtekcityBPDevice
+from .profiler import profiled
 
 
 if TYPE_CHECKING:
@@ -51,13 +52,18 @@ class EtekcityBPCoordinator(
         base_unique_id: str,
         device_name: str,
         connectable: bool,
+        passive: bool = False,
     ) -> None:
         """Initialize data coordinator."""
         super().__init__(
             hass=hass,
             logger=logger,
             address=address,
-            mode=bluetooth.BluetoothScanningMode.ACTIVE,
+            mode=(
+                bluetooth.BluetoothScanningMode.PASSIVE
+                if passive
+                else bluetooth.BluetoothScanningMode.ACTIVE
+            ),
             update_method=self._update_method,
             needs_poll_method=self._needs_poll,
             poll_method=self._async_update,
@@ -67,13 +73,19 @@ class EtekcityBPCoordinator(
         self.device = device
         self.device_name = device_name
         self.base_unique_id = base_unique_id
+        self.passive = passive
         self._ready_event = asyncio.Event()
         self._was_unavailable = True
+        self._stopped = False
 
-        _LOGGER.debug("In EtekcityBPCoordinator init")
-        _LOGGER.debug(f"Scanner count: {bluetooth.async_scanner_count(hass, connectable=True)}")
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Scanner count: %s",
+                bluetooth.async_scanner_count(hass, connectable=True),
+            )
 
     @callback
+    @profiled
     def _needs_poll(
         self,
         service_info: bluetooth.BluetoothServiceInfoBleak,
@@ -81,7 +93,6 @@ class EtekcityBPCoordinator(
     ) -> bool:
         # Only poll if hass is running, we need to poll,
         # and we actually have a way to connect to the device
-        _LOGGER.debug("In _needs_poll callback")
         needs_poll = (
             self.hass.state == CoreState.running
             and self.device.poll_needed(seconds_since_last_poll)
@@ -91,14 +102,19 @@ class EtekcityBPCoordinator(
                 )
             )
         )
-        _LOGGER.debug(f"needs_poll1: {self.hass.state == CoreState.running}")
-        _LOGGER.debug(f"needs_poll2: {self.device.poll_needed(seconds_since_last_poll)}")
-        _LOGGER.debug(f"needs_poll3: {bool(bluetooth.async_ble_device_from_address(self.hass, service_info.device.address, connectable=True))}")
+        self.device.trace.record("needs_poll", needs_poll)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "%s needs poll: %s (seconds since last poll: %s)",
+                self.device_name,
+                needs_poll,
+                seconds_since_last_poll,
+            )
         return needs_poll
 
     def _update_method(self, service_info) -> PassiveBluetoothDataUpdate:
         """Update method for the coordinator."""
-        _LOGGER.debug(f"In _update_method, service_info: {service_info}")
+        _LOGGER.debug("In _update_method, service_info: %s", service_info)
         # This method is called when the coordinator is updated.
         # It can be used to update the device state or perform other actions.
         if self._was_unavailable:
@@ -111,13 +127,20 @@ class EtekcityBPCoordinator(
     ) -> None:
         """Poll the device."""
         _LOGGER.debug("In _async_update")
-        while self._available:
+        if self.passive:
+            await self._async_update_on_demand(service_info)
+            return
+        stats = self.device.stats
+        while self._available and not self._stopped:
             try:
-                _LOGGER.debug(f"Connecting to device {service_info.device.address}")
+                _LOGGER.debug("Connecting to device %s", service_info.device.address)
+                self.device.trace.record("connect", service_info.device.address)
+                stats.connect_attempt()
                 async with BleakClient(service_info.device) as client:
                     if (not client.is_connected):
                         raise "client not connected"
 
+                    stats.session_started()
                     _LOGGER.debug ("Starting notifications")
                     await client.start_notify(CHARACTERISTIC_BLOOD_PRESSURE, self._notification_handler)
                     await client.write_gatt_descriptor(CLIENT_CHARACTERISTIC_CONFIG_HANDLE, CLIENT_CHARACTERISTIC_CONFIG_DATA)
@@ -126,17 +149,59 @@ class EtekcityBPCoordinator(
                     _LOGGER.debug ("Pausing notification processing")
                     async with asyncio.timeout(10):
                         await client.stop_notify(CHARACTERISTIC_BLOOD_PRESSURE)
+                    self.device.mark_synced()
                     await asyncio.sleep(1)
             except Exception as e:
-                _LOGGER.debug(f"Error {e}; Long pausing notification processing")
+                stats.connect_failures += 1
+                _LOGGER.debug("Error %s; Long pausing notification processing", e)
+                self.device.trace.record("connect_error", repr(e))
                 await asyncio.sleep(30)
+            finally:
+                stats.session_finished()
+            # Outside of measurement windows stop connecting until an
+            # advertisement asks for the next poll.
+            if not self.device.poll_needed(0):
+                self.device.trace.record("idle", None)
+                break
+
+    async def _async_update_on_demand(
+        self, service_info: bluetooth.BluetoothServiceInfoBleak
+    ) -> None:
+        """Connect once to read the monitor after its advertisement changed."""
+        ble_device = bluetooth.async_ble_device_from_address(
+            self.hass, service_info.device.address, connectable=True
+        )
+        if ble_device is None:
+            _LOGGER.debug("No connectable scanner for %s", self.device_name)
+            return
+        stats = self.device.stats
+        stats.connect_attempt()
+        self.device.trace.record("connect", ble_device.address)
+        try:
+            async with BleakClient(ble_device) as client:
+                stats.session_started()
+                await client.start_notify(CHARACTERISTIC_BLOOD_PRESSURE, self._notification_handler)
+                await client.write_gatt_descriptor(CLIENT_CHARACTERISTIC_CONFIG_HANDLE, CLIENT_CHARACTERISTIC_CONFIG_DATA)
+                await asyncio.sleep(5)
+                async with asyncio.timeout(10):
+                    await client.stop_notify(CHARACTERISTIC_BLOOD_PRESSURE)
+        except Exception as e:
+            stats.connect_failures += 1
+            _LOGGER.debug("Error %s reading %s on demand", e, self.device_name)
+            self.device.trace.record("connect_error", repr(e))
+            return
+        finally:
+            stats.session_finished()
+        self.device.mark_synced()
 
     @callback
+    @profiled
     async def _notification_handler(self, handle, data):
         """Handle notifications from the device."""
-        _LOGGER.debug("In _notification_handler")
-        _LOGGER.debug(f"Handle: {handle}, Data: {data.hex()}")
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Handle: %s, Data: %s", handle, data.hex())
 
+        self.device.stats.notification_received()
         await self.device.update(data)
 
     @callback
@@ -153,28 +218,34 @@ class EtekcityBPCoordinator(
 
 
     @callback
+    @profiled
     def _async_handle_bluetooth_event(
         self,
         service_info: bluetooth.BluetoothServiceInfoBleak,
         change: bluetooth.BluetoothChange,
     ) -> None:
         """Handle a Bluetooth event."""
+        # Process incoming advertisement data before the base class decides
+        # whether to poll, so passive mode sees the announced data.
+        _LOGGER.debug("Bluetooth event %s: %s", change, service_info)
+        self.device.stats.advertisement_received()
+        parsed = self.device.parse_advertisement_data(
+            service_info.device, service_info.advertisement
+        )
         super()._async_handle_bluetooth_event(service_info, change)
-        # Process incoming advertisement data
-        _LOGGER.debug("In _async_handle_bluetooth_event")
-        _LOGGER.debug(f"service_info: {service_info}")
-        _LOGGER.debug(f"change: {change}")
-
-        if not (
-            self.device.parse_advertisement_data(
-                service_info.device, service_info.advertisement
-            )
-        ):
+
+        if not parsed:
             return
 
         self._ready_event.set()
         self._was_unavailable = False
 
+    @callback
+    def _async_stop(self) -> None:
+        """Stop the poll loop along with the Bluetooth callbacks."""
+        self._stopped = True
+        super()._async_stop()
+
     async def async_wait_ready(self) -> bool:
         """Wait for the device to be ready."""
         _LOGGER.debug("In async_wait_ready")
@@ -4,6 +4,8 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 import logging
+import math
+import time
 
 from collections.abc import Callable
 from typing import Any
@@ -11,10 +13,25 @@ from typing import Any
 from bleak.backends.device import BLEDevice
 from bleak.backends.scanner import AdvertisementData
 
-from .const import MFR_ID
+from .const import (
+    MAX_PRESSURE_KPA_X10,
+    MAX_PRESSURE_MMHG,
+    MFR_ID,
+    MMHG_PER_KPA,
+)
+from .duty_cycle import IDLE_POLL_INTERVAL, EtekcityBPDutyCycle
+from .profiler import profiled
+from .readings import COUNTED_READINGS_SIZE, EtekcityBPSeenReadings
+from .stats import EtekcityBPStats
+from .trace import EtekcityBPTrace
 
 _LOGGER = logging.getLogger(__name__)
 
+# Indexed by a pressure in kPa x 10, so decoding needs no float arithmetic.
+KPA_X10_TO_MMHG = tuple(
+    round(kpa_x10 * MMHG_PER_KPA / 10) for kpa_x10 in range(MAX_PRESSURE_KPA_X10 + 1)
+)
+
 
 @dataclass
 class EtekcityBPData:
@@ -38,8 +55,10 @@ class EtekcityBPDevice():
 
     def __init__(
         self,
+        trace_size: int = 0,
+        measurement_hours: list[int] | None = None,
+        passive: bool = False,
     ) -> None:
-        _LOGGER.debug("In EtekcityBPDevice init")
         self._data: EtekcityBPData = EtekcityBPData(
             sensor_data={
                 "systolic0": None, 
@@ -54,20 +73,42 @@ class EtekcityBPDevice():
                 }
             )
         self._callbacks: list[Callable[[], None]] = []
-        self._user = None  # Placeholder for user
+        # User, pressures and stamp of a 0xA522 frame waiting for its pulse.
+        self._pending_reading: tuple[int, int, int, bytes] | None = None
+        self._units_kpa = False
+        self._synced_mfr_data: bytes | None = None
+        self._passive = passive
+        self._seen_readings = EtekcityBPSeenReadings()
+        # The seen set forgets readings after a while; these are never
+        # forgotten, so a reading delivered again later is not counted twice
+        # by the duty cycle.
+        self._counted_readings = EtekcityBPSeenReadings(COUNTED_READINGS_SIZE, math.inf)
+        self.stats = EtekcityBPStats()
+        self.trace = EtekcityBPTrace(trace_size)
+        self.duty_cycle = EtekcityBPDutyCycle(measurement_hours)
 
     def poll_needed(self, seconds_since_last_poll: float | None) -> bool:
         """Return if device needs polling."""
-        _LOGGER.debug("In EtekcityBPDevice poll_needed")
-        return True
+        # New advertisement data wakes the device outside of its usual
+        # measurement times.
+        if self.advertisement_has_new_data:
+            return True
+        if self._passive:
+            # The payload may never change on some monitors, so passive mode
+            # still reads them now and then.
+            return (
+                seconds_since_last_poll is None
+                or seconds_since_last_poll >= IDLE_POLL_INTERVAL
+            )
+        return self.duty_cycle.poll_needed(seconds_since_last_poll)
 
+    @profiled
     def parse_advertisement_data(
         self,
         device: BLEDevice,
         advertisement_data: AdvertisementData,
     ) -> bool | None:
         """Parse advertisement data."""
-        _LOGGER.debug("In EtekcityBPDevice parse_advertisement_data")
         _mfr_data = None
         if MFR_ID in advertisement_data.manufacturer_data:
             _mfr_data = advertisement_data.manufacturer_data[MFR_ID]
@@ -79,10 +120,59 @@ class EtekcityBPDevice():
         self._data.device = device
         self._data.rssi = advertisement_data.rssi
         self._data.mfr_id = MFR_ID
-        self._data.mfr_data=_mfr_data
+        if _mfr_data == self._data.mfr_data:
+            return True
+
+        self._data.mfr_data = _mfr_data
+        # The payload layout is not documented, so it is not decoded. A
+        # change only wakes the device; readings and units come from the
+        # notifications read over a connection.
+        self.trace.record("advertisement", _mfr_data)
 
         return True
 
+    @staticmethod
+    def _pressure_mmhg(raw: int, kpa: bool) -> int | None:
+        """Return a raw pressure in mmHg, or None if out of range."""
+        if kpa:
+            return KPA_X10_TO_MMHG[raw] if raw <= MAX_PRESSURE_KPA_X10 else None
+        return raw if raw <= MAX_PRESSURE_MMHG else None
+
+    def _is_new_reading(self, reading: tuple, stamp: bytes | None = None) -> bool:
+        """Return if a reading was not ingested yet, from any source.
+
+        A reading is the user, systolic, diastolic, pulse and irregular
+        heartbeat; the stamp is unknown for restored readings.
+        """
+        if self._seen_readings.add(reading, stamp):
+            if self._counted_readings.add(reading, stamp):
+                self.duty_cycle.record_measurement()
+            return True
+        self.stats.duplicates_rejected += 1
+        self.trace.record("duplicate", reading)
+        return False
+
+    def _apply_reading(self, reading: tuple) -> bool:
+        """Update a user's sensors from a reading, returning if any changed."""
+        user, systolic, diastolic, pulse, irregular_heartbeat = reading
+        changed = self.update_value(f"systolic{user}", systolic)
+        changed |= self.update_value(f"diastolic{user}", diastolic)
+        changed |= self.update_value(f"pulse{user}", pulse)
+        changed |= self.update_value(f"irregular_heartbeat{user}", irregular_heartbeat)
+        return changed
+
+    @property
+    def advertisement_has_new_data(self) -> bool:
+        """Return if the advertisement changed since data was last read."""
+        return (
+            self._data.mfr_data is not None
+            and self._data.mfr_data != self._synced_mfr_data
+        )
+
+    def mark_synced(self) -> None:
+        """Record that the data announced by the last advertisement was read."""
+        self._synced_mfr_data = self._data.mfr_data
+
     def subscribe(self, callback: Callable[[], None]) -> Callable[[], None]:
         """Subscribe to device notifications."""
         _LOGGER.debug("In EtekcityBPDevice subscribe")
@@ -94,34 +184,103 @@ class EtekcityBPDevice():
 
         return _unsub
 
+    def _async_notify_callbacks(self) -> None:
+        """Notify subscribers that sensor data changed."""
+        for callback in self._callbacks:
+            callback()
+
+    @profiled
     async def update(self, data: bytes):
         """Update values from notification packet."""
+        received = time.monotonic()
+        self.trace.record("notification", data)
         header = int.from_bytes(data[0:2], "big")
         if header == 0xA502 and len(data) == 13:
-            _LOGGER.debug(f"Advertisement received")
-            self.update_value("display_units", "kPa" if data[10] == 0x01 else "mmHg")
+            # Sent once per connection; readings in the session use this mode.
+            self._units_kpa = data[10] == 0x01
+            changed = self.update_value("display_units", "kPa" if self._units_kpa else "mmHg")
         elif header == 0xA522 and len(data) == 20:
-            self._user = data[14]
-            self.update_value(f"systolic{self._user}", data[15])
-            self.update_value(f"diastolic{self._user}", data[17])
-        elif data[0] == 0x00 and len(data) == 5:
-            self.update_value(f"pulse{self._user}", data[1])
-            self.update_value(f"irregular_heartbeat{self._user}", True if data[3] == 0x04 else False)
-
-    def update_value(self, parameter: str, value: int):
-        """Update single value."""
-        _LOGGER.debug(f"Updating device {parameter} to {value}")
+            systolic = self._pressure_mmhg(data[15] | data[16] << 8, self._units_kpa)
+            diastolic = self._pressure_mmhg(data[17] | data[18] << 8, self._units_kpa)
+            if systolic is None or diastolic is None:
+                self.stats.decode_errors += 1
+                self.trace.record("decode_error", data)
+                self._pending_reading = None
+                return
+            # The pulse frame that follows completes the reading. Bytes 2-13
+            # are not decoded; they are kept as a stamp so readings with the
+            # same values but different contents there are not merged.
+            self._pending_reading = (data[14], systolic, diastolic, bytes(data[2:14]))
+            return
+        elif len(data) == 5 and data[0] == 0x00:
+            if self._pending_reading is None:
+                return
+            user, systolic, diastolic, stamp = self._pending_reading
+            self._pending_reading = None
+            reading = (user, systolic, diastolic, data[1], data[3] == 0x04)
+            if not self._is_new_reading(reading, stamp):
+                return
+            changed = self._apply_reading(reading)
+        else:
+            self.stats.decode_errors += 1
+            self.trace.record("decode_error", data)
+            return
+        if not changed:
+            return
+        self._async_notify_callbacks()
+        self.stats.notification_to_state_write.observe(
+            (time.monotonic() - received) * 1000
+        )
+
+    def update_value(self, parameter: str, value: int) -> bool:
+        """Update single value, returning if it changed."""
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Updating device %s to %s", parameter, value)
+        if self._data.sensor_data.get(parameter) == value:
+            return False
         self._data.sensor_data[parameter] = value
+        return True
+
+    def restore_value(self, parameter: str, value: Any) -> None:
+        """Restore a value saved before a restart.
+
+        Restored readings are marked as seen, so the monitor delivering the
+        same reading again after the restart is not ingested twice.
+        """
+        sensor_data = self._data.sensor_data
+        if sensor_data.get(parameter) is not None:
+            return
+        if parameter.startswith("irregular_heartbeat"):
+            # Binary sensors restore their state as "on" or "off".
+            value = value in (True, "on")
+        sensor_data[parameter] = value
+        if not parameter.startswith(("systolic", "diastolic", "pulse", "irregular")):
+            return
+        user = parameter[-1]
+        irregular_heartbeat = sensor_data[f"irregular_heartbeat{user}"]
+        if irregular_heartbeat is None:
+            return
+        try:
+            reading = (
+                int(user),
+                int(float(sensor_data[f"systolic{user}"])),
+                int(float(sensor_data[f"diastolic{user}"])),
+                int(float(sensor_data[f"pulse{user}"])),
+                irregular_heartbeat,
+            )
+        except (TypeError, ValueError):
+            return
+        self._seen_readings.add(reading)
+        self._counted_readings.add(reading)
 
-    def supported(self, discovery_info) -> bool:
+    @staticmethod
+    def supported(discovery_info) -> bool:
         """Return if device is supported."""
-        _LOGGER.debug("In EtekcityBPDevice supported")
-        return discovery_info.manufacturer_data and MFR_ID in discovery_info.manufacturer_data
+        return MFR_ID in discovery_info.manufacturer_data
 
     @property
     def name(self) -> str:
         """Return device name."""
-        _LOGGER.debug("In EtekcityBPDevice name")
         return f"{self._device.name} ({self._device.address})"
 
     @property
@@ -132,7 +291,6 @@ class EtekcityBPDevice():
     @property
     def rssi(self) -> int:
         """Return RSSI of device."""
-        _LOGGER.debug("In EtekcityBPDevice rssi")
         if self._data:
             return self._data.rssi
         return -127
@@ -0,0 +1,60 @@
+"""Diagnostics support for EtekcityBP BLE."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import REDACTED, async_redact_data
+from homeassistant.core import HomeAssistant
+
+from .coordinator import EtekcityConfigEntry
+
+# Readings are health data, and the title may carry the monitor's address.
+TO_REDACT = {
+    "title",
+    *(
+        f"{reading}{user}"
+        for reading in ("systolic", "diastolic", "pulse", "irregular_heartbeat")
+        for user in (0, 1)
+    ),
+}
+# Trace entries whose data is a raw payload or a reading. Frames keep their
+# two byte header so decode errors can still be told apart.
+TRACE_PAYLOADS = {"advertisement", "duplicate"}
+TRACE_FRAMES = {"notification", "decode_error"}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: EtekcityConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator = entry.runtime_data
+    device = coordinator.device
+    return async_redact_data(
+        {
+            "entry": {
+                "title": entry.title,
+                "options": dict(entry.options),
+            },
+            "passive": coordinator.passive,
+            "available": coordinator.available,
+            "sensor_data": device.sensor_data,
+            "stats": device.stats.as_dict(),
+            "duty_cycle": device.duty_cycle.as_dict(),
+            "trace": _redact_trace(device.trace.dump(), coordinator.address),
+        },
+        TO_REDACT,
+    )
+
+
+def _redact_trace(entries: list[dict[str, Any]], address: str) -> list[dict[str, Any]]:
+    """Redact readings and the monitor's address from trace entries."""
+    for entry in entries:
+        data = entry["data"]
+        if entry["kind"] in TRACE_PAYLOADS:
+            entry["data"] = REDACTED
+        elif entry["kind"] in TRACE_FRAMES:
+            entry["data"] = f"{data[:4]} {REDACTED}"
+        elif isinstance(data, str):
+            entry["data"] = data.replace(address, REDACTED)
+    return entries
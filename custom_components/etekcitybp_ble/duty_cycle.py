@@ -0,0 +1,65 @@
+"""Adaptive connection duty cycle for the EtekcityBP integration."""
+
+from __future__ import annotations
+
+import time
+from typing import Any
+
+HOURS = 24
+# Connect on every cycle until this many readings have been learned.
+MIN_HISTORY = 5
+# Outside of measurement windows, connect at most this often.
+IDLE_POLL_INTERVAL = 1800
+# Halve the histogram when it reaches this many readings, so it follows
+# changing habits.
+DECAY_TOTAL = 200
+
+
+class EtekcityBPDutyCycle:
+    """Learns when a monitor is used and decides when to connect.
+
+    Readings are counted per local hour. An hour is a measurement window
+    when it has at least an average share of the readings; the hour before
+    a window is treated as part of it so connections start early.
+    """
+
+    __slots__ = ("_hours", "_total")
+
+    def __init__(self, hours: list[int] | None = None) -> None:
+        """Initialize from a stored histogram."""
+        self._hours = list(hours) if hours and len(hours) == HOURS else [0] * HOURS
+        self._total = sum(self._hours)
+
+    def record_measurement(self) -> None:
+        """Count a new reading in the current hour."""
+        # This is the hour the reading was received, not taken. The 0xA522
+        # frame's timestamp is not decoded, and outside of windows a reading
+        # can wait up to IDLE_POLL_INTERVAL for the next connection, so late
+        # readings may land in the following hour.
+        self._hours[time.localtime().tm_hour] += 1
+        self._total += 1
+        if self._total >= DECAY_TOTAL:
+            self._hours = [count // 2 for count in self._hours]
+            self._total = sum(self._hours)
+
+    def in_window(self, hour: int) -> bool:
+        """Return if an hour is, or is just before, a measurement window."""
+        if self._total < MIN_HISTORY:
+            return True
+        hours = self._hours
+        return (
+            hours[hour] * HOURS >= self._total
+            or hours[(hour + 1) % HOURS] * HOURS >= self._total
+        )
+
+    def poll_needed(self, seconds_since_last_poll: float | None) -> bool:
+        """Return if a connection should be made now."""
+        if seconds_since_last_poll is None:
+            return True
+        if self.in_window(time.localtime().tm_hour):
+            return True
+        return seconds_since_last_poll >= IDLE_POLL_INTERVAL
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the histogram for storage and diagnostics."""
+        return {"hours": list(self._hours)}
@@ -14,6 +14,7 @@ from homeassistant.const import (
 from homeassistant.core import callback
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.restore_state import RestoreEntity
 
 from .const import DOMAIN, MANUFACTURER
@@ -25,7 +26,7 @@ IGNORED_STATES = {STATE_UNAVAILABLE, STATE_UNKNOWN}
 _LOGGER = logging.getLogger(__name__)
 
 
-class EtekcityBPEntity(RestoreEntity):
+class EtekcityBPBaseEntity(Entity):
     """Generic entity encapsulating common features of EtekcityBP device."""
 
     _device: EtekcityBPDevice
@@ -66,16 +67,16 @@ class EtekcityBPEntity(RestoreEntity):
     @callback
     def _async_update_attrs(self) -> None:
         """Update the entity attributes."""
-        _LOGGER.debug("In EtekcityBPEntity _async_update_attrs")
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle data update."""
-        _LOGGER.debug(
-            "_handle_coordinator_update: Updating entity %s with data: %s",
-            self._attr_unique_id,
-            self.sensor_data,
-        )  
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "_handle_coordinator_update: Updating entity %s with data: %s",
+                self._attr_unique_id,
+                self.sensor_data,
+            )
         self._async_update_attrs()
         self.async_write_ha_state()
 
@@ -85,16 +86,24 @@ class EtekcityBPEntity(RestoreEntity):
         await super().async_added_to_hass()
         self.async_on_remove(self._device.subscribe(self._handle_coordinator_update))
 
+
+class EtekcityBPEntity(EtekcityBPBaseEntity, RestoreEntity):
+    """EtekcityBP entity that restores its reading after a restart."""
+
+    async def async_added_to_hass(self) -> None:
+        """Register callbacks and restore the last known state."""
+        await super().async_added_to_hass()
+
         # Set initial state based on the last known state and sensor data
         last_state = await self.async_get_last_state()
         # last_sensor_data = await self.async_get_last_sensor_data()
-        _LOGGER.debug(f"last_state: {last_state}")
+        _LOGGER.debug("last_state: %s", last_state)
         # _LOGGER.debug(f"last_sensor_data: {last_sensor_data}")
 
         # if not last_state or not last_sensor_data or last_state.state in IGNORED_STATES:
         if not last_state or last_state.state in IGNORED_STATES:
             return
         # _LOGGER.debug(f"Restoring sensor to {last_sensor_data.native_value}")
-        _LOGGER.debug(f"Restoring sensor to {last_state.state}")
+        _LOGGER.debug("Restoring sensor to %s", last_state.state)
         self._attr_native_value = last_state.state
-        self._device.update_value(self._sensor, last_state.state)
+        self._device.restore_value(self._sensor, last_state.state)
@@ -0,0 +1,135 @@
+"""Scoped profiler for the EtekcityBP integration."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from functools import wraps
+from inspect import iscoroutinefunction
+import logging
+import os
+import time
+import tracemalloc
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+INTEGRATION_DIR = os.path.dirname(__file__)
+TOP_ALLOCATIONS = 25
+
+_profile_lock = asyncio.Lock()
+# Call counts and times by entry point while a profile is running.
+_timings: dict[str, list[float]] | None = None
+
+
+def _record(name: str, elapsed: float) -> None:
+    """Add a call to the running profile."""
+    if _timings is None:
+        return
+    timing = _timings.get(name)
+    if timing is None:
+        _timings[name] = [1, elapsed, elapsed]
+        return
+    timing[0] += 1
+    timing[1] += elapsed
+    if elapsed > timing[2]:
+        timing[2] = elapsed
+
+
+def profiled(func: Callable) -> Callable:
+    """Time calls to an entry point while a profile is running.
+
+    Only the decorated functions are timed, so profiling does not slow down
+    the rest of Home Assistant. Outside of a profile the cost is one check.
+    """
+    name = func.__qualname__
+
+    if iscoroutinefunction(func):
+
+        @wraps(func)
+        async def _async_wrapper(*args: Any, **kwargs: Any) -> Any:
+            if _timings is None:
+                return await func(*args, **kwargs)
+            started = time.perf_counter()
+            try:
+                return await func(*args, **kwargs)
+            finally:
+                _record(name, time.perf_counter() - started)
+
+        return _async_wrapper
+
+    @wraps(func)
+    def _wrapper(*args: Any, **kwargs: Any) -> Any:
+        if _timings is None:
+            return func(*args, **kwargs)
+        started = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _record(name, time.perf_counter() - started)
+
+    return _wrapper
+
+
+async def async_profile(hass: HomeAssistant, seconds: float, allocations: bool) -> str:
+    """Profile the integration for a number of seconds and write a report."""
+    global _timings
+
+    if _profile_lock.locked():
+        raise HomeAssistantError("A profile is already running")
+
+    async with _profile_lock:
+        start_tracemalloc = allocations and not tracemalloc.is_tracing()
+        if start_tracemalloc:
+            tracemalloc.start()
+        _timings = {}
+        started = time.monotonic()
+        try:
+            await asyncio.sleep(seconds)
+        finally:
+            timings, _timings = _timings, None
+            snapshot = tracemalloc.take_snapshot() if allocations else None
+            if start_tracemalloc:
+                tracemalloc.stop()
+        elapsed = time.monotonic() - started
+
+    path = hass.config.path(f"{DOMAIN}_profile_{int(time.time())}.txt")
+    await hass.async_add_executor_job(
+        _write_report, path, elapsed, timings, snapshot
+    )
+    _LOGGER.info("Profile report written to %s", path)
+    return path
+
+
+def _write_report(
+    path: str,
+    elapsed: float,
+    timings: dict[str, list[float]],
+    snapshot: tracemalloc.Snapshot | None,
+) -> None:
+    """Write the profile report, slowest entry points first."""
+    with open(path, "w", encoding="utf-8") as report:
+        report.write(f"{DOMAIN} profile over {elapsed:.1f} seconds\n\n")
+        report.write(
+            f"{'calls':>10} {'total ms':>10} {'mean ms':>10} {'max ms':>10}  entry point\n"
+        )
+        for name, (calls, total, slowest) in sorted(
+            timings.items(), key=lambda item: item[1][1], reverse=True
+        ):
+            report.write(
+                f"{calls:>10} {total * 1000:>10.3f} {total / calls * 1000:>10.4f} "
+                f"{slowest * 1000:>10.3f}  {name}\n"
+            )
+        if snapshot is None:
+            return
+        allocations = snapshot.filter_traces(
+            [tracemalloc.Filter(True, os.path.join(INTEGRATION_DIR, "*"))]
+        ).statistics("lineno")[:TOP_ALLOCATIONS]
+        report.write(f"\nTop {TOP_ALLOCATIONS} allocations\n")
+        for stat in allocations:
+            report.write(f"{stat}\n")
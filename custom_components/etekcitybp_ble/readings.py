@@ -0,0 +1,59 @@
+"""Reading deduplication for the EtekcityBP integration."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Hashable
+import time
+
+SEEN_READINGS_SIZE = 32
+SEEN_READINGS_MAX_AGE = 3600
+# The last readings counted by the duty cycle, a few per user.
+COUNTED_READINGS_SIZE = 4
+
+
+class EtekcityBPSeenReadings:
+    """Bounded set of recently ingested readings that forgets old entries.
+
+    A reading may carry a stamp, raw bytes that differ between measurements
+    with the same values. Readings from sources without a stamp match any
+    stamp, so they are still recognised across sources.
+    """
+
+    __slots__ = ("_seen", "_max_size", "_max_age")
+
+    def __init__(
+        self,
+        max_size: int = SEEN_READINGS_SIZE,
+        max_age: float = SEEN_READINGS_MAX_AGE,
+    ) -> None:
+        """Initialize the set."""
+        self._seen: OrderedDict[Hashable, tuple[float, Hashable | None]] = OrderedDict()
+        self._max_size = max_size
+        self._max_age = max_age
+
+    def add(self, key: Hashable, stamp: Hashable | None = None) -> bool:
+        """Record a reading, returning False if it was seen recently.
+
+        A reading seen again is kept for another max age, so one that keeps
+        being delivered stays suppressed.
+        """
+        now = time.monotonic()
+        seen = self._seen
+        while seen and now - seen[next(iter(seen))][0] >= self._max_age:
+            seen.popitem(last=False)
+        entry = seen.get(key)
+        is_new = entry is None or (
+            stamp is not None and entry[1] is not None and stamp != entry[1]
+        )
+        if not is_new and stamp is None:
+            stamp = entry[1]
+        seen[key] = (now, stamp)
+        seen.move_to_end(key)
+        if len(seen) > self._max_size:
+            seen.popitem(last=False)
+        return is_new
+
+    def __len__(self) -> int:
+        """Return the number of remembered readings."""
+        return len(self._seen)
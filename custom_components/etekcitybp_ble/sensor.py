@@ -14,13 +14,15 @@ from homeassistant.const import (
         EntityCategory,
         SIGNAL_STRENGTH_DECIBELS_MILLIWATT,
         UnitOfPressure,
+        UnitOfTime,
 )
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 
 from .const import BPM
 from .coordinator import EtekcityConfigEntry, EtekcityBPCoordinator
-from .entity import EtekcityBPEntity
+from .entity import EtekcityBPBaseEntity, EtekcityBPEntity
+from .profiler import profiled
 
 import logging
 
@@ -94,6 +96,83 @@ SENSOR_TYPES: dict[str, SensorEntityDescription] = {
     ),
 }
 
+STATS_SENSOR_TYPES: dict[str, SensorEntityDescription] = {
+    "advertisements_per_minute": SensorEntityDescription(
+        key="advertisements_per_minute",
+        name ="Advertisements Per Minute",
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_registry_enabled_default=False,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    "connect_attempts": SensorEntityDescription(
+        key="connect_attempts",
+        name ="Connect Attempts",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_registry_enabled_default=False,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    "connect_attempts_today": SensorEntityDescription(
+        key="connect_attempts_today",
+        name ="Connect Attempts Today",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_registry_enabled_default=False,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    "connect_failures": SensorEntityDescription(
+        key="connect_failures",
+        name ="Connect Failures",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_registry_enabled_default=False,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    "notifications": SensorEntityDescription(
+        key="notifications",
+        name ="Notifications",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_registry_enabled_default=False,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    "decode_errors": SensorEntityDescription(
+        key="decode_errors",
+        name ="Decode Errors",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_registry_enabled_default=False,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    "duplicates_rejected": SensorEntityDescription(
+        key="duplicates_rejected",
+        name ="Duplicates Rejected",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_registry_enabled_default=False,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    "connect_to_first_notification": SensorEntityDescription(
+        key="connect_to_first_notification",
+        name ="Connect To First Notification",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_registry_enabled_default=False,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    "notifications_per_session": SensorEntityDescription(
+        key="notifications_per_session",
+        name ="Notifications Per Session",
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_registry_enabled_default=False,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    "notification_to_state_write": SensorEntityDescription(
+        key="notification_to_state_write",
+        name ="Notification To State Write",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_registry_enabled_default=False,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+}
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -109,7 +188,10 @@ async def async_setup_entry(
         if sensor != "rssi" 
     ]
     entities.append(EtekcityBPRSSISensor(coordinator, "rssi"))
-    _LOGGER.debug(f"Adding entities: {entities}")
+    entities.extend(
+        EtekcityBPStatsSensor(coordinator, sensor) for sensor in STATS_SENSOR_TYPES
+    )
+    _LOGGER.debug("Adding entities: %s", entities)
     async_add_entities(entities)
 
    
@@ -121,7 +203,7 @@ class EtekcityBPSensor(EtekcityBPEntity, SensorEntity):
         sensor: str,
     ) -> None:
         """Initialize the EtekcityBP sensor."""
-        _LOGGER.debug(f"Initializing sensor: {sensor}")
+        _LOGGER.debug("Initializing sensor: %s", sensor)
         super().__init__(coordinator)
         self.coordinator = coordinator
         self._sensor = sensor
@@ -129,11 +211,10 @@ class EtekcityBPSensor(EtekcityBPEntity, SensorEntity):
         self.entity_description = SENSOR_TYPES[sensor]
 
     @property
+    @profiled
     def native_value(self) -> int | None:
         """Return the state of the sensor."""
-        value = self.sensor_data.get(self._sensor, self._attr_native_value)
-        _LOGGER.debug(f"{self._sensor} native_value: {value}")
-        return value
+        return self.sensor_data.get(self._sensor, self._attr_native_value)
 
 
 
@@ -146,6 +227,26 @@ class EtekcityBPRSSISensor(EtekcityBPSensor):
         if service_info := async_last_service_info(
             self.hass, self._address, self.coordinator.connectable
         ):
-            _LOGGER.debug(f"rssi: {service_info.rssi}")
             return service_info.rssi
-        return None
\ No newline at end of file
+        return None
+
+
+class EtekcityBPStatsSensor(EtekcityBPBaseEntity, SensorEntity):
+    """Representation of a EtekcityBP runtime statistic sensor."""
+
+    def __init__(
+        self,
+        coordinator: EtekcityBPCoordinator,
+        sensor: str,
+    ) -> None:
+        """Initialize the EtekcityBP statistic sensor."""
+        super().__init__(coordinator)
+        self.coordinator = coordinator
+        self._sensor = sensor
+        self._attr_unique_id = f"{coordinator.base_unique_id}-{sensor}"
+        self.entity_description = STATS_SENSOR_TYPES[sensor]
+
+    @property
+    def native_value(self) -> float | int | None:
+        """Return the state of the sensor."""
+        return self._device.stats.value(self._sensor)
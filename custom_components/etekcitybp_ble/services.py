@@ -0,0 +1,76 @@
+"""Services for the EtekcityBP integration."""
+
+from __future__ import annotations
+
+import json
+import time
+
+import voluptuous as vol
+
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+)
+
+from .const import (
+    ATTR_ALLOCATIONS,
+    ATTR_SECONDS,
+    DOMAIN,
+    SERVICE_DUMP_TRACE,
+    SERVICE_PROFILE,
+)
+from .profiler import async_profile
+
+PROFILE_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_SECONDS, default=60): vol.All(
+            vol.Coerce(float), vol.Range(min=1, max=300)
+        ),
+        vol.Optional(ATTR_ALLOCATIONS, default=False): bool,
+    }
+)
+
+
+async def _async_profile(call: ServiceCall) -> ServiceResponse:
+    """Profile the integration and return the report path."""
+    path = await async_profile(
+        call.hass, call.data[ATTR_SECONDS], call.data[ATTR_ALLOCATIONS]
+    )
+    return {"path": path}
+
+
+async def _async_dump_trace(call: ServiceCall) -> ServiceResponse:
+    """Write the trace buffer of every loaded monitor to a file."""
+    hass = call.hass
+    traces = {
+        entry.unique_id: entry.runtime_data.device.trace.dump()
+        for entry in hass.config_entries.async_loaded_entries(DOMAIN)
+    }
+    path = hass.config.path(f"{DOMAIN}_trace_{int(time.time())}.json")
+    await hass.async_add_executor_job(_write_json, path, traces)
+    return {"path": path}
+
+
+def _write_json(path: str, data: dict) -> None:
+    """Write data as JSON."""
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(data, file, indent=2)
+
+
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the integration services."""
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_PROFILE,
+        _async_profile,
+        schema=PROFILE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_DUMP_TRACE,
+        _async_dump_trace,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
@@ -0,0 +1,196 @@
+"""Runtime statistics for the EtekcityBP integration."""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from datetime import date
+import time
+from typing import Any
+
+# Bucket upper bounds, in milliseconds for latencies.
+LATENCY_BUCKETS_MS = (1, 5, 10, 50, 100, 500, 1000, 5000)
+CONNECT_BUCKETS_MS = (100, 250, 500, 1000, 2500, 5000, 10000)
+NOTIFICATIONS_BUCKETS = (0, 1, 2, 4, 8, 16, 32)
+# The advertisement rate is averaged over this many complete minutes.
+ADVERTISEMENT_RATE_MINUTES = 5
+
+
+class EtekcityBPHistogram:
+    """Fixed-bucket histogram that does not allocate when observing."""
+
+    __slots__ = ("bounds", "counts", "count", "total")
+
+    def __init__(self, bounds: tuple[float, ...]) -> None:
+        """Initialize the histogram."""
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+
+    def observe(self, value: float) -> None:
+        """Record a value."""
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+
+    @property
+    def mean(self) -> float | None:
+        """Return the mean of the recorded values."""
+        if not self.count:
+            return None
+        return round(self.total / self.count, 2)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the histogram as a dict."""
+        buckets = {f"le_{bound}": count for bound, count in zip(self.bounds, self.counts)}
+        buckets["inf"] = self.counts[-1]
+        return {"count": self.count, "mean": self.mean, "buckets": buckets}
+
+
+class EtekcityBPStats:
+    """Counters and histograms for the coordinator and device hot paths."""
+
+    __slots__ = (
+        "started",
+        "advertisements",
+        "_advertisement_minute",
+        "_advertisements_by_minute",
+        "connect_attempts",
+        "connect_failures",
+        "notifications",
+        "decode_errors",
+        "duplicates_rejected",
+        "_day",
+        "_connect_attempts_today",
+        "_connect_attempts_yesterday",
+        "connect_to_first_notification",
+        "notifications_per_session",
+        "notification_to_state_write",
+        "_session_started",
+        "_session_notifications",
+    )
+
+    def __init__(self) -> None:
+        """Initialize the statistics."""
+        self.started = time.monotonic()
+        self.advertisements = 0
+        self._advertisement_minute = int(self.started // 60)
+        # One count per minute, including the current partial minute.
+        self._advertisements_by_minute = [0] * (ADVERTISEMENT_RATE_MINUTES + 1)
+        self.connect_attempts = 0
+        self.connect_failures = 0
+        self.notifications = 0
+        self.decode_errors = 0
+        self.duplicates_rejected = 0
+        self._day = date.today()
+        self._connect_attempts_today = 0
+        self._connect_attempts_yesterday: int | None = None
+        self.connect_to_first_notification = EtekcityBPHistogram(CONNECT_BUCKETS_MS)
+        self.notifications_per_session = EtekcityBPHistogram(NOTIFICATIONS_BUCKETS)
+        self.notification_to_state_write = EtekcityBPHistogram(LATENCY_BUCKETS_MS)
+        self._session_started: float | None = None
+        self._session_notifications = 0
+
+    def _roll_day(self) -> None:
+        """Start a new daily count when the date changes."""
+        today = date.today()
+        if today == self._day:
+            return
+        yesterday = self._connect_attempts_today if (today - self._day).days == 1 else 0
+        self._day = today
+        self._connect_attempts_today = 0
+        self._connect_attempts_yesterday = yesterday
+
+    def _roll_minute(self) -> int:
+        """Clear the counts of minutes that passed since the last roll."""
+        minute = int(time.monotonic() // 60)
+        last = self._advertisement_minute
+        if minute != last:
+            counts = self._advertisements_by_minute
+            for passed in range(last + 1, min(minute, last + len(counts)) + 1):
+                counts[passed % len(counts)] = 0
+            self._advertisement_minute = minute
+        return minute
+
+    def advertisement_received(self) -> None:
+        """Record an advertisement."""
+        minute = self._roll_minute()
+        self.advertisements += 1
+        self._advertisements_by_minute[minute % len(self._advertisements_by_minute)] += 1
+
+    def connect_attempt(self) -> None:
+        """Record a connection attempt."""
+        self._roll_day()
+        self.connect_attempts += 1
+        self._connect_attempts_today += 1
+
+    @property
+    def connect_attempts_today(self) -> int:
+        """Return the connection attempts made today."""
+        self._roll_day()
+        return self._connect_attempts_today
+
+    @property
+    def connect_attempts_yesterday(self) -> int | None:
+        """Return the connection attempts made yesterday."""
+        self._roll_day()
+        return self._connect_attempts_yesterday
+
+    def session_started(self) -> None:
+        """Record a connection being established."""
+        self._session_started = time.monotonic()
+        self._session_notifications = 0
+
+    def session_finished(self) -> None:
+        """Record the end of a connection."""
+        if self._session_started is None:
+            return
+        self.notifications_per_session.observe(self._session_notifications)
+        self._session_started = None
+
+    def notification_received(self) -> None:
+        """Record a notification."""
+        self.notifications += 1
+        self._session_notifications += 1
+        if self._session_notifications == 1 and self._session_started is not None:
+            self.connect_to_first_notification.observe(
+                (time.monotonic() - self._session_started) * 1000
+            )
+
+    @property
+    def advertisements_per_minute(self) -> float:
+        """Return the advertisement rate over the last complete minutes."""
+        minute = self._roll_minute()
+        counts = self._advertisements_by_minute
+        minutes = min(ADVERTISEMENT_RATE_MINUTES, minute - int(self.started // 60))
+        if minutes <= 0:
+            return 0.0
+        current = counts[minute % len(counts)]
+        return round((sum(counts) - current) / minutes, 2)
+
+    def value(self, key: str) -> float | int | None:
+        """Return a single statistic by key."""
+        if key == "advertisements_per_minute":
+            return self.advertisements_per_minute
+        stat = getattr(self, key)
+        if isinstance(stat, EtekcityBPHistogram):
+            return stat.mean
+        return stat
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return all statistics as a dict."""
+        return {
+            "uptime_seconds": round(time.monotonic() - self.started),
+            "advertisements": self.advertisements,
+            "advertisements_per_minute": self.advertisements_per_minute,
+            "connect_attempts": self.connect_attempts,
+            "connect_attempts_today": self.connect_attempts_today,
+            "connect_attempts_yesterday": self.connect_attempts_yesterday,
+            "connect_failures": self.connect_failures,
+            "notifications": self.notifications,
+            "decode_errors": self.decode_errors,
+            "duplicates_rejected": self.duplicates_rejected,
+            "connect_to_first_notification_ms": self.connect_to_first_notification.as_dict(),
+            "notifications_per_session": self.notifications_per_session.as_dict(),
+            "notification_to_state_write_ms": self.notification_to_state_write.as_dict(),
+        }
@@ -0,0 +1,46 @@
+"""Per-device trace buffer for the EtekcityBP integration."""
+
+from __future__ import annotations
+
+from collections import deque
+import time
+from typing import Any
+
+
+class EtekcityBPTrace:
+    """Ring buffer of the last raw packets and decisions for a device.
+
+    Entries are stored as tuples and only formatted when dumped, so
+    recording is cheap and a disabled trace costs a single check.
+    """
+
+    __slots__ = ("_buffer",)
+
+    def __init__(self, size: int = 0) -> None:
+        """Initialize the trace, disabled when size is 0."""
+        self._buffer: deque[tuple[float, str, Any]] | None = (
+            deque(maxlen=size) if size > 0 else None
+        )
+
+    @property
+    def enabled(self) -> bool:
+        """Return if the trace is recording."""
+        return self._buffer is not None
+
+    def record(self, kind: str, data: Any) -> None:
+        """Record a raw packet or a decision."""
+        if self._buffer is not None:
+            self._buffer.append((time.time(), kind, data))
+
+    def dump(self) -> list[dict[str, Any]]:
+        """Return the recorded entries, oldest first."""
+        if self._buffer is None:
+            return []
+        return [
+            {
+                "time": timestamp,
+                "kind": kind,
+                "data": data.hex() if isinstance(data, (bytes, bytearray)) else data,
+            }
+            for timestamp, kind, data in self._buffer
+        ]
@@ -0,0 +1,340 @@
+"""Scale and memory harness for the EtekcityBP integration.
+
+Sets up N config entries against simulated monitors in one process, through
+async_setup_entry and async_unload_entry with the Bluetooth manager mocked,
+and checks event loop lag, memory per monitor after setup and after the
+run, and setup and unload time against budgets. Exits non-zero when a
+budget is exceeded.
+
+    pip install homeassistant
+    python scripts/scale_harness.py --monitors 100
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections.abc import Callable
+import logging
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from homeassistant import loader  # noqa: E402
+from homeassistant.bootstrap import async_load_base_functionality  # noqa: E402
+from homeassistant.components import bluetooth  # noqa: E402
+from homeassistant.components.bluetooth import passive_update_processor  # noqa: E402
+from homeassistant.config_entries import (  # noqa: E402
+    ConfigEntries,
+    ConfigEntry,
+    ConfigEntryState,
+)
+from homeassistant.const import CONF_ADDRESS  # noqa: E402
+from homeassistant.core import CoreState, HomeAssistant  # noqa: E402
+from homeassistant.helpers import (  # noqa: E402
+    device_registry as dr,
+    entity_registry as er,
+)
+from homeassistant.helpers.storage import Store  # noqa: E402
+
+import custom_components.etekcitybp_ble as integration  # noqa: E402
+from custom_components.etekcitybp_ble import coordinator as coordinator_module  # noqa: E402
+from custom_components.etekcitybp_ble.const import (  # noqa: E402
+    CONF_PASSIVE_MODE,
+    CONF_TRACE_SIZE,
+    DOMAIN,
+)
+from simulator import LOCAL_NAME, MONITORS, FakeBleakClient, SimulatedMonitor  # noqa: E402
+
+_LOGGER = logging.getLogger(__name__)
+
+LAG_INTERVAL = 0.01
+UNLOAD_TIMEOUT = 10
+
+
+def _scaled_asyncio(scale: float) -> SimpleNamespace:
+    """Return the asyncio module with sleeps shortened by scale."""
+    sleep = asyncio.sleep
+
+    async def _sleep(delay: float, result=None):
+        return await sleep(delay * scale, result)
+
+    return SimpleNamespace(**{**vars(asyncio), "sleep": _sleep})
+
+
+async def _measure_lag(stop: asyncio.Event, lags: list[float]) -> None:
+    """Record how late the event loop wakes a sleeping task."""
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        started = loop.time()
+        await asyncio.sleep(LAG_INTERVAL)
+        lags.append((loop.time() - started - LAG_INTERVAL) * 1000)
+
+
+class FakeBluetoothManager:
+    """Stands in for the Bluetooth manager's callback registrations."""
+
+    def __init__(self) -> None:
+        """Initialize the manager."""
+        self.callbacks: dict[str, Callable] = {}
+
+    def async_register_callback(
+        self, hass: HomeAssistant, callback: Callable, matcher: dict, mode: Any
+    ) -> Callable[[], None]:
+        """Register an advertisement callback for an address."""
+        address = matcher[CONF_ADDRESS]
+        self.callbacks[address] = callback
+        return lambda: self.callbacks.pop(address, None)
+
+
+async def _advertise(
+    manager: FakeBluetoothManager,
+    monitors: list[SimulatedMonitor],
+    stop: asyncio.Event,
+    interval: float,
+    measure_probability: float,
+) -> int:
+    """Send advertisements from every monitor until stopped."""
+    rng = random.Random(0)
+    sent = 0
+    while not stop.is_set():
+        for monitor in monitors:
+            if rng.random() < measure_probability:
+                monitor.measure()
+            callback = manager.callbacks.get(monitor.address)
+            if callback is not None:
+                callback(monitor.service_info(), bluetooth.BluetoothChange.ADVERTISEMENT)
+                sent += 1
+        await asyncio.sleep(interval)
+    return sent
+
+
+async def _async_noop(*args: Any, **kwargs: Any) -> None:
+    """Do nothing, in place of calls that need a Bluetooth adapter."""
+
+
+def _traced_size() -> int:
+    """Return the memory traced by tracemalloc, leaving out the harness's own."""
+    snapshot = tracemalloc.take_snapshot().filter_traces(
+        (tracemalloc.Filter(False, __file__),)
+    )
+    return sum(stat.size for stat in snapshot.statistics("filename"))
+
+
+async def _async_flush_registries(hass: HomeAssistant) -> None:
+    """Write the registries now rather than after their save delay.
+
+    Writing caches each registry entry's storage form, so flushing before
+    measuring keeps that cost in the setup figure instead of landing in
+    the run figure at an arbitrary point.
+    """
+    for registry in (dr.async_get(hass), er.async_get(hass)):
+        await registry._store._async_handle_write_data()
+
+
+async def _async_start_hass(config_dir: str) -> HomeAssistant:
+    """Start a Home Assistant core with the integration's dependencies marked loaded."""
+    hass = HomeAssistant(config_dir)
+    hass.config.skip_pip = True
+    loader.async_setup(hass)
+    hass.config_entries = ConfigEntries(hass, {})
+    await async_load_base_functionality(hass)
+    hass.set_state(CoreState.running)
+    # The Bluetooth manager is replaced by FakeBluetoothManager.
+    hass.config.components.update({"bluetooth", "bluetooth_adapters"})
+    await passive_update_processor.async_setup(hass)
+    return hass
+
+
+async def _async_seed_hours(hass: HomeAssistant, entry: ConfigEntry, hours: list[int]) -> None:
+    """Store learned measurement hours for an entry before it is set up."""
+    await Store(hass, integration.STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}").async_save(
+        {"hours": hours}
+    )
+
+
+async def async_run(args: argparse.Namespace, manager: FakeBluetoothManager) -> dict[str, float]:
+    """Run the harness and return its measurements."""
+    hass = await _async_start_hass(tempfile.mkdtemp())
+
+    monitors = [SimulatedMonitor(index, kpa=index % 2 == 1) for index in range(args.monitors)]
+    entries = [
+        ConfigEntry(
+            version=1,
+            minor_version=1,
+            domain=DOMAIN,
+            title=f"{LOCAL_NAME} ({monitor.address})",
+            data={CONF_ADDRESS: monitor.address},
+            source="user",
+            options={CONF_PASSIVE_MODE: args.passive, CONF_TRACE_SIZE: args.trace_size},
+            unique_id=monitor.address,
+            discovery_keys={},
+            subentries_data=None,
+        )
+        for monitor in monitors
+    ]
+    if args.measurement_hours:
+        hours = [0] * 24
+        for hour in args.measurement_hours.split(","):
+            hours[int(hour)] = 10
+        for entry in entries:
+            await _async_seed_hours(hass, entry, hours)
+
+    # Load the integration once so its import is not counted per monitor.
+    await loader.async_get_integration(hass, DOMAIN)
+
+    tracemalloc.start()
+    baseline = _traced_size()
+    started = time.perf_counter()
+    for entry in entries:
+        await hass.config_entries.async_add(entry)
+    setup_ms = (time.perf_counter() - started) * 1000
+    await _async_flush_registries(hass)
+    setup_bytes = (_traced_size() - baseline) / args.monitors
+    loaded = [entry for entry in entries if entry.state is ConfigEntryState.LOADED]
+    devices = [entry.runtime_data.device for entry in loaded]
+    entities = len(er.async_get(hass).entities) / args.monitors
+
+    stop = asyncio.Event()
+    lags: list[float] = []
+    lag_task = asyncio.create_task(_measure_lag(stop, lags))
+    advertise_task = asyncio.create_task(
+        _advertise(
+            manager,
+            monitors,
+            stop,
+            args.advertisement_interval,
+            args.measure_probability,
+        )
+    )
+    await asyncio.sleep(args.duration)
+    stop.set()
+    advertisements = await advertise_task
+    await lag_task
+    run_bytes = (_traced_size() - baseline) / args.monitors
+    tracemalloc.stop()
+
+    started = time.perf_counter()
+    for entry in entries:
+        await hass.config_entries.async_unload(entry.entry_id)
+    # Connections still running after unload keep this from finishing.
+    try:
+        async with asyncio.timeout(UNLOAD_TIMEOUT):
+            await hass.async_block_till_done(wait_background_tasks=True)
+    except TimeoutError:
+        _LOGGER.error("Polls still running %s seconds after unload", UNLOAD_TIMEOUT)
+    unload_ms = (time.perf_counter() - started) * 1000
+    leaked_callbacks = len(manager.callbacks)
+    await hass.async_stop(force=True)
+
+    lags.sort()
+    return {
+        "monitors": args.monitors,
+        "not_loaded": args.monitors - len(loaded),
+        "entities_per_monitor": entities,
+        "advertisements": advertisements,
+        "connections": sum(monitor.connections for monitor in monitors),
+        "notifications": sum(device.stats.notifications for device in devices),
+        "decode_errors": sum(device.stats.decode_errors for device in devices),
+        "loop_lag_mean_ms": statistics.fmean(lags) if lags else 0.0,
+        "loop_lag_p99_ms": lags[int(len(lags) * 0.99)] if lags else 0.0,
+        "loop_lag_max_ms": lags[-1] if lags else 0.0,
+        "setup_bytes_per_monitor": setup_bytes,
+        "run_bytes_per_monitor": run_bytes,
+        "setup_ms_per_monitor": setup_ms / args.monitors,
+        "unload_ms": unload_ms,
+        "leaked_callbacks": leaked_callbacks,
+    }
+
+
+def check_budgets(results: dict[str, float], args: argparse.Namespace) -> list[str]:
+    """Return a message for each budget that was exceeded."""
+    budgets = (
+        ("loop_lag_p99_ms", args.max_loop_lag_p99_ms),
+        ("setup_bytes_per_monitor", args.max_setup_bytes_per_monitor),
+        ("run_bytes_per_monitor", args.max_run_bytes_per_monitor),
+        ("setup_ms_per_monitor", args.max_setup_ms_per_monitor),
+        ("unload_ms", args.max_unload_ms),
+        ("not_loaded", 0),
+        ("decode_errors", 0),
+        ("leaked_callbacks", 0),
+    )
+    return [
+        f"{key} {results[key]:.2f} exceeds budget {budget}"
+        for key, budget in budgets
+        if results[key] > budget
+    ]
+
+
+def main() -> int:
+    """Run the harness from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--monitors", type=int, default=100)
+    parser.add_argument("--duration", type=float, default=10, help="seconds")
+    parser.add_argument("--advertisement-interval", type=float, default=1.0, help="seconds")
+    parser.add_argument("--measure-probability", type=float, default=0.05)
+    parser.add_argument(
+        "--time-scale",
+        type=float,
+        default=0.01,
+        help="factor applied to the coordinator's connection sleeps",
+    )
+    parser.add_argument("--passive", action="store_true")
+    parser.add_argument("--trace-size", type=int, default=0)
+    parser.add_argument(
+        "--measurement-hours",
+        help="comma separated local hours to seed each monitor's learned habits",
+    )
+    parser.add_argument("--max-loop-lag-p99-ms", type=float, default=25)
+    parser.add_argument("--max-setup-bytes-per-monitor", type=float, default=196608)
+    parser.add_argument("--max-run-bytes-per-monitor", type=float, default=229376)
+    parser.add_argument("--max-setup-ms-per-monitor", type=float, default=50)
+    parser.add_argument("--max-unload-ms", type=float, default=1000)
+    args = parser.parse_args()
+
+    manager = FakeBluetoothManager()
+    with (
+        patch.object(coordinator_module, "BleakClient", FakeBleakClient),
+        patch.object(coordinator_module, "asyncio", _scaled_asyncio(args.time_scale)),
+        patch.object(
+            bluetooth,
+            "async_ble_device_from_address",
+            lambda hass, address, connectable=True: MONITORS[address].ble_device,
+        ),
+        patch.object(bluetooth, "async_scanner_count", lambda hass, connectable=True: 1),
+        patch(
+            "homeassistant.components.bluetooth.update_coordinator.async_address_present",
+            return_value=True,
+        ),
+        patch(
+            "homeassistant.components.bluetooth.update_coordinator.async_register_callback",
+            manager.async_register_callback,
+        ),
+        patch(
+            "homeassistant.components.bluetooth.update_coordinator.async_track_unavailable",
+            lambda *args, **kwargs: lambda: None,
+        ),
+        patch.object(integration, "close_stale_connections_by_address", _async_noop),
+    ):
+        results = asyncio.run(async_run(args, manager))
+
+    for key, value in results.items():
+        print(f"{key:>24}: {value:.2f}" if isinstance(value, float) else f"{key:>24}: {value}")
+    failures = check_budgets(results, args)
+    for failure in failures:
+        print(f"FAIL {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
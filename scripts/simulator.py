@@ -0,0 +1,158 @@
+"""Stand-in Etekcity blood pressure monitors for local testing.
+
+A SimulatedMonitor produces the 0xA502, 0xA522 and pulse notification
+frames a real monitor sends, and FakeBleakClient delivers those frames in
+place of bleak's BleakClient. The real MFR_ID advertisement payload is not
+documented, so simulated advertisements carry the MAC address and a
+measurement count, which changes with each new reading.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+import random
+import time
+from typing import Any
+
+from bleak.backends.device import BLEDevice
+from bleak.backends.scanner import AdvertisementData
+from homeassistant.components.bluetooth import BluetoothServiceInfoBleak
+
+from custom_components.etekcitybp_ble.const import MFR_ID
+
+LOCAL_NAME = "Smart Blood Pressure Monitor"
+SOURCE = "simulator"
+
+# Simulated monitors by address, used by FakeBleakClient to find its peer.
+MONITORS: dict[str, SimulatedMonitor] = {}
+
+
+def _ble_device(address: str) -> BLEDevice:
+    """Create a BLEDevice across bleak versions."""
+    try:
+        return BLEDevice(address, LOCAL_NAME, {})
+    except TypeError:
+        return BLEDevice(address, LOCAL_NAME, {}, -60)
+
+
+class SimulatedMonitor:
+    """A simulated monitor holding its latest reading."""
+
+    def __init__(self, index: int, *, kpa: bool = False, seed: int | None = None) -> None:
+        """Initialize the monitor and register it by address."""
+        self.mac = bytes((0xC0, 0xFF, 0xEE, index >> 16 & 0xFF, index >> 8 & 0xFF, index & 0xFF))
+        self.address = ":".join(f"{byte:02X}" for byte in self.mac)
+        self.kpa = kpa
+        self.ble_device = _ble_device(self.address)
+        self.user = 0
+        self.systolic = 0
+        self.diastolic = 0
+        self.pulse = 0
+        self.irregular_heartbeat = False
+        self.new_data = False
+        self.measurements = 0
+        self.connections = 0
+        self._random = random.Random(seed if seed is not None else index)
+        MONITORS[self.address] = self
+
+    def measure(self) -> None:
+        """Take a new reading for a random user."""
+        self.user = self._random.randint(0, 1)
+        systolic = self._random.randint(95, 260)
+        diastolic = self._random.randint(55, min(systolic - 20, 160))
+        # kPa readings are carried as kPa x 10.
+        self.systolic = round(systolic * 1.33322) if self.kpa else systolic
+        self.diastolic = round(diastolic * 1.33322) if self.kpa else diastolic
+        self.pulse = self._random.randint(45, 150)
+        self.irregular_heartbeat = self._random.random() < 0.05
+        self.new_data = True
+        self.measurements += 1
+
+    def manufacturer_data(self) -> bytes:
+        """Return the MFR_ID payload for the current state."""
+        return self.mac + (self.measurements & 0xFFFF).to_bytes(2, "little")
+
+    def service_info(self, rssi: int = -60) -> BluetoothServiceInfoBleak:
+        """Return an advertisement as seen by a scanner."""
+        manufacturer_data = {MFR_ID: self.manufacturer_data()}
+        advertisement = AdvertisementData(
+            local_name=LOCAL_NAME,
+            manufacturer_data=manufacturer_data,
+            service_data={},
+            service_uuids=[],
+            tx_power=None,
+            rssi=rssi,
+            platform_data=(),
+        )
+        return BluetoothServiceInfoBleak(
+            name=LOCAL_NAME,
+            address=self.address,
+            rssi=rssi,
+            manufacturer_data=manufacturer_data,
+            service_data={},
+            service_uuids=[],
+            source=SOURCE,
+            device=self.ble_device,
+            advertisement=advertisement,
+            connectable=True,
+            time=time.monotonic(),
+            tx_power=None,
+        )
+
+    def notification_frames(self) -> list[bytes]:
+        """Return the notification frames for the current reading."""
+        units = bytearray(13)
+        units[0:2] = b"\xa5\x02"
+        units[10] = 0x01 if self.kpa else 0x00
+        reading = bytearray(20)
+        reading[0:2] = b"\xa5\x22"
+        reading[14] = self.user
+        reading[15:17] = self.systolic.to_bytes(2, "little")
+        reading[17:19] = self.diastolic.to_bytes(2, "little")
+        pulse = bytes((0x00, self.pulse, 0x00, 0x04 if self.irregular_heartbeat else 0x00, 0x00))
+        return [bytes(units), bytes(reading), pulse]
+
+
+class FakeBleakClient:
+    """Mock bleak backend that connects to a SimulatedMonitor."""
+
+    def __init__(self, device: BLEDevice | str, *args: Any, **kwargs: Any) -> None:
+        """Initialize the client."""
+        address = device if isinstance(device, str) else device.address
+        self._monitor = MONITORS[address]
+        self.is_connected = False
+        self._tasks: set[asyncio.Task] = set()
+
+    async def __aenter__(self) -> FakeBleakClient:
+        """Connect to the monitor."""
+        self._monitor.connections += 1
+        self.is_connected = True
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        """Disconnect from the monitor."""
+        for task in self._tasks:
+            task.cancel()
+        self.is_connected = False
+
+    async def start_notify(self, characteristic: str, callback: Callable) -> None:
+        """Deliver the current reading as notifications."""
+        monitor = self._monitor
+        frames = monitor.notification_frames() if monitor.new_data else []
+        monitor.new_data = False
+        task = asyncio.get_running_loop().create_task(self._deliver(callback, frames))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _deliver(self, callback: Callable, frames: list[bytes]) -> None:
+        """Send frames to the notification handler."""
+        for frame in frames:
+            await asyncio.sleep(0)
+            await callback(0x0E, bytearray(frame))
+
+    async def write_gatt_descriptor(self, handle: int, data: bytes) -> None:
+        """Accept descriptor writes."""
+
+    async def stop_notify(self, characteristic: str) -> None:
+        """Stop notifications."""
@@ -0,0 +1,129 @@
+"""Tests for the EtekcityBP device."""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+
+from custom_components.etekcitybp_ble.const import (
+    MAX_PRESSURE_KPA_X10,
+    MAX_PRESSURE_MMHG,
+    MFR_ID,
+)
+from custom_components.etekcitybp_ble.device import KPA_X10_TO_MMHG, EtekcityBPDevice
+from custom_components.etekcitybp_ble.duty_cycle import IDLE_POLL_INTERVAL
+
+ADDRESS = "C0:FF:EE:00:00:01"
+
+
+def _advertise(device: EtekcityBPDevice, payload: bytes) -> None:
+    """Pass an advertisement carrying a manufacturer payload to the device."""
+    device.parse_advertisement_data(
+        SimpleNamespace(address=ADDRESS),
+        SimpleNamespace(manufacturer_data={MFR_ID: payload}, rssi=-60),
+    )
+
+
+def _units_frame(kpa: bool) -> bytes:
+    """Return the 0xA502 frame announcing the session's display units."""
+    frame = bytearray(13)
+    frame[0:2] = b"\xa5\x02"
+    frame[10] = 0x01 if kpa else 0x00
+    return bytes(frame)
+
+
+def _reading_frames(
+    user: int, systolic: int, diastolic: int, pulse: int
+) -> list[bytes]:
+    """Return the 0xA522 and pulse frames of a reading with raw pressures."""
+    reading = bytearray(20)
+    reading[0:2] = b"\xa5\x22"
+    reading[14] = user
+    reading[15:17] = systolic.to_bytes(2, "little")
+    reading[17:19] = diastolic.to_bytes(2, "little")
+    return [bytes(reading), bytes((0x00, pulse, 0x00, 0x00, 0x00))]
+
+
+def _deliver(device: EtekcityBPDevice, frames: list[bytes]) -> None:
+    """Pass notification frames to the device."""
+
+    async def _update() -> None:
+        for frame in frames:
+            await device.update(frame)
+
+    asyncio.run(_update())
+
+
+def test_kpa_session_is_converted_to_mmhg() -> None:
+    """Test a reading in a kPa session is converted to mmHg."""
+    device = EtekcityBPDevice()
+    _deliver(device, [_units_frame(kpa=True), *_reading_frames(1, 160, 107, 70)])
+
+    assert device.sensor_data["display_units"] == "kPa"
+    assert device.sensor_data["systolic1"] == KPA_X10_TO_MMHG[160] == 120
+    assert device.sensor_data["diastolic1"] == KPA_X10_TO_MMHG[107] == 80
+    assert device.sensor_data["pulse1"] == 70
+    assert device.sensor_data["systolic0"] is None
+
+
+def test_mmhg_pressure_above_one_byte() -> None:
+    """Test a systolic pressure above 255 mmHg is read from both bytes."""
+    device = EtekcityBPDevice()
+    _deliver(device, [_units_frame(kpa=False), *_reading_frames(0, 300, 90, 80)])
+
+    assert device.sensor_data["display_units"] == "mmHg"
+    assert device.sensor_data["systolic0"] == 300
+    assert device.sensor_data["diastolic0"] == 90
+
+
+def test_out_of_range_pressure_drops_the_reading() -> None:
+    """Test an out of range pressure counts an error and drops its pulse frame."""
+    device = EtekcityBPDevice()
+    _deliver(device, _reading_frames(0, MAX_PRESSURE_MMHG + 1, 80, 70))
+    _deliver(
+        device,
+        [
+            _units_frame(kpa=True),
+            *_reading_frames(0, 160, MAX_PRESSURE_KPA_X10 + 1, 70),
+        ],
+    )
+
+    assert device.stats.decode_errors == 2
+    assert device.sensor_data["systolic0"] is None
+    assert device.sensor_data["pulse0"] is None
+
+    _deliver(device, _reading_frames(0, 160, 107, 70))
+    assert device.stats.decode_errors == 2
+    assert device.sensor_data["systolic0"] == 120
+
+
+def test_passive_advertisement_does_not_publish_readings() -> None:
+    """Test a payload that looks like a reading is not published."""
+    device = EtekcityBPDevice(passive=True)
+    _advertise(device, bytes.fromhex("010203040506000178005000" "4699"))
+
+    assert device.sensor_data["systolic1"] is None
+    assert device.sensor_data["display_units"] is None
+    assert device.poll_needed(60)
+
+
+def test_passive_connects_when_payload_changes() -> None:
+    """Test passive mode connects once per payload change."""
+    device = EtekcityBPDevice(passive=True)
+    _advertise(device, bytes.fromhex("0102030405060100"))
+    device.mark_synced()
+    assert not device.poll_needed(60)
+
+    _advertise(device, bytes.fromhex("0102030405060200"))
+    assert device.poll_needed(60)
+
+
+def test_passive_static_payload_still_polls() -> None:
+    """Test a payload that never changes does not stop passive reads."""
+    device = EtekcityBPDevice(passive=True)
+    _advertise(device, bytes.fromhex("010203040506"))
+    device.mark_synced()
+    _advertise(device, bytes.fromhex("010203040506"))
+
+    assert not device.poll_needed(60)
+    assert device.poll_needed(IDLE_POLL_INTERVAL)
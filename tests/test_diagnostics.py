@@ -0,0 +1,46 @@
+"""Tests for EtekcityBP diagnostics."""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+
+from homeassistant.components.diagnostics import REDACTED
+
+from custom_components.etekcitybp_ble.device import EtekcityBPDevice
+from custom_components.etekcitybp_ble.diagnostics import (
+    async_get_config_entry_diagnostics,
+)
+
+ADDRESS = "C0:FF:EE:00:00:01"
+
+
+def test_diagnostics_redact_readings_and_address() -> None:
+    """Test readings and the address are redacted but the trace is kept."""
+    device = EtekcityBPDevice(trace_size=10)
+    device.update_value("systolic0", 120)
+    device.update_value("display_units", "mmHg")
+    device.trace.record("needs_poll", True)
+    device.trace.record("connect", ADDRESS)
+    device.trace.record("connect_error", f"Device {ADDRESS} not found")
+    device.trace.record("notification", bytes.fromhex("a522") + bytes(18))
+    entry = SimpleNamespace(
+        title=f"Smart Blood Pressure Monitor ({ADDRESS})",
+        options={},
+        runtime_data=SimpleNamespace(
+            device=device, address=ADDRESS, passive=False, available=True
+        ),
+    )
+
+    diagnostics = asyncio.run(async_get_config_entry_diagnostics(None, entry))
+
+    assert diagnostics["entry"]["title"] == REDACTED
+    assert diagnostics["sensor_data"]["systolic0"] == REDACTED
+    assert diagnostics["sensor_data"]["display_units"] == "mmHg"
+    assert [entry["data"] for entry in diagnostics["trace"]] == [
+        True,
+        REDACTED,
+        f"Device {REDACTED} not found",
+        f"a522 {REDACTED}",
+    ]
+    assert ADDRESS not in str(diagnostics)
@@ -0,0 +1,81 @@
+"""Tests for counting readings in the EtekcityBP duty cycle."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import patch
+
+from custom_components.etekcitybp_ble import readings
+from custom_components.etekcitybp_ble.device import EtekcityBPDevice
+
+
+def _frames(systolic: int, diastolic: int, pulse: int) -> list[bytes]:
+    """Return the 0xA522 and pulse frames of a user 1 reading in mmHg."""
+    reading = bytearray(20)
+    reading[0:2] = b"\xa5\x22"
+    reading[15:17] = systolic.to_bytes(2, "little")
+    reading[17:19] = diastolic.to_bytes(2, "little")
+    return [bytes(reading), bytes((0x00, pulse, 0x00, 0x00, 0x00))]
+
+
+def _deliver(device: EtekcityBPDevice, frames: list[bytes]) -> None:
+    """Pass notification frames to the device."""
+
+    async def _update() -> None:
+        for frame in frames:
+            await device.update(frame)
+
+    asyncio.run(_update())
+
+
+def test_redelivered_reading_is_counted_once() -> None:
+    """Test a reading delivered on every connection is counted once."""
+    device = EtekcityBPDevice()
+    _deliver(device, _frames(120, 80, 70))
+    hours = device.duty_cycle.as_dict()["hours"]
+    assert sum(hours) == 1
+
+    for _ in range(3):
+        _deliver(device, _frames(120, 80, 70))
+
+    assert device.duty_cycle.as_dict()["hours"] == hours
+    assert device.stats.duplicates_rejected == 3
+
+
+def test_redelivered_reading_after_seen_set_expired() -> None:
+    """Test a reading delivered after the seen set forgot it is not counted."""
+    device = EtekcityBPDevice()
+    _deliver(device, _frames(120, 80, 70))
+    hours = device.duty_cycle.as_dict()["hours"]
+
+    now = readings.time.monotonic() + readings.SEEN_READINGS_MAX_AGE
+    with patch.object(readings.time, "monotonic", return_value=now):
+        _deliver(device, _frames(120, 80, 70))
+
+    assert device.duty_cycle.as_dict()["hours"] == hours
+
+
+def test_restored_reading_is_not_counted() -> None:
+    """Test the monitor delivering a restored reading does not count it."""
+    device = EtekcityBPDevice()
+    for parameter, value in (
+        ("systolic0", "120"),
+        ("diastolic0", "80"),
+        ("pulse0", "70"),
+        ("irregular_heartbeat0", "off"),
+    ):
+        device.restore_value(parameter, value)
+
+    _deliver(device, _frames(120, 80, 70))
+
+    assert sum(device.duty_cycle.as_dict()["hours"]) == 0
+
+
+def test_new_pulse_is_a_new_reading() -> None:
+    """Test readings with the same pressures but another pulse both count."""
+    device = EtekcityBPDevice()
+    _deliver(device, _frames(120, 80, 70))
+    _deliver(device, _frames(120, 80, 72))
+
+    assert sum(device.duty_cycle.as_dict()["hours"]) == 2
+    assert device.sensor_data["pulse0"] == 72